@@ -9,14 +9,15 @@ by the library
 # =============================================================================
 
 # Standard
-from os.path import dirname
+from os.path import dirname, getmtime
 
 # Third party
 import pandas as pd
 import numpy as np
+from sklearn.preprocessing import LabelEncoder
 
 # Local application
-from teacher.utils import recognize_features_type, set_discrete_continuous, label_encode
+from teacher.utils import recognize_features_type, set_discrete_continuous
 
 
 # =============================================================================
@@ -30,6 +31,79 @@ MODULE_PATH = dirname(__file__)
 # Functions
 # =============================================================================
 
+def _read_cached(csv_path, **read_csv_kwargs):
+    """Read a csv dataset, keeping a binary copy next to it so that
+    subsequent loads skip the text parsing.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path of the csv file with the dataset
+    **read_csv_kwargs
+        Extra arguments forwarded to :func:`pandas.read_csv`
+
+    Returns
+    -------
+    df : pandas.core.frame.DataFrame
+        Pandas DataFrame with the dataset
+    """
+    cache_path = csv_path + '.pkl'
+    try:
+        if getmtime(cache_path) >= getmtime(csv_path):
+            return pd.read_pickle(cache_path)
+    except Exception:
+        # A missing, corrupt or incompatible cache falls through to the
+        # csv and gets rewritten below
+        pass
+
+    df = pd.read_csv(csv_path, **read_csv_kwargs)
+    try:
+        df.to_pickle(cache_path)
+    except OSError:  # pragma: no cover - e.g. read-only installations
+        pass
+    return df
+
+
+def _label_encode(df, columns):
+    """Label-encode the discrete columns of a DataFrame with one
+    hash-based factorization per column, building the equivalent
+    fitted sklearn LabelEncoder objects without a second scan.
+
+    Parameters
+    ----------
+    df : pandas.core.frame.DataFrame
+        Pandas DataFrame with the data to encode
+    columns : list
+        List with the discrete columns to encode
+
+    Returns
+    -------
+    df_le : pandas.core.frame.DataFrame
+        Pandas DataFrame with the columns encoded
+    label_encoder : dict
+        Dictionary with format {column: LabelEncoder}
+    """
+    df_le = df.copy(deep=True)
+    label_encoder = {}
+    for col in columns:
+        codes, uniques = pd.factorize(df_le[col], use_na_sentinel=False)
+        uniques = np.asarray(uniques)
+        # Remap the appearance-ordered codes to the sorted-class codes
+        # that LabelEncoder.fit_transform would have produced, keeping
+        # missing values as their own class sorted last
+        idx = np.arange(uniques.size)
+        na_mask = pd.isna(uniques)
+        order = np.concatenate([idx[~na_mask][np.argsort(uniques[~na_mask], kind='stable')], idx[na_mask]])
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        df_le[col] = rank[codes]
+
+        le = LabelEncoder()
+        le.classes_ = uniques[order]
+        label_encoder[col] = le
+    return df_le, label_encoder
+
+
 def generate_dataset(df, columns, class_name, discrete, name):
     """Generate the dataset suitable for LORE usage
 
@@ -74,9 +148,9 @@ def generate_dataset(df, columns, class_name, discrete, name):
     idx_features = {i: col for i, col in enumerate(columns_tmp)}
 
     # Dataset Preparation for Scikit Alorithms
-    df_le, label_encoder = label_encode(df, discrete)
-    X = df_le.loc[:, df_le.columns != class_name].values
-    y = df_le[class_name].values
+    df_le, label_encoder = _label_encode(df, discrete)
+    X = df_le.drop(columns=class_name).to_numpy()
+    y = df_le[class_name].to_numpy()
 
     dataset = {
         'name': name,
@@ -107,7 +181,7 @@ def load_german():
     """
 
     # Read Dataset
-    df = pd.read_csv(MODULE_PATH + '/data/german_credit.csv', delimiter=',')
+    df = _read_cached(MODULE_PATH + '/data/german_credit.csv', delimiter=',')
 
     # Features Categorization
     columns = df.columns
@@ -128,15 +202,15 @@ def load_adult():
     """
 
     # Read Dataset
-    df = pd.read_csv(MODULE_PATH + '/data/adult.csv', delimiter=',', skipinitialspace=True)
+    df = _read_cached(MODULE_PATH + '/data/adult.csv', delimiter=',', skipinitialspace=True)
 
     # Remove useless columns
     del df['fnlwgt']
     del df['education-num']
 
     # Remove Missing Values
-    for col in df.columns:
-        df[col].replace('?', df[col].value_counts().index[0], inplace=True)
+    missing = df.eq('?')
+    df = df.mask(missing, df.mode().iloc[0], axis=1)
 
     # Features Categorization
     columns = df.columns.tolist()
@@ -157,7 +231,7 @@ def load_compas():
     dataset : dict
     """
     # Read Dataset
-    df = pd.read_csv(MODULE_PATH + '/data/compas-scores-two-years.csv', delimiter=',', skipinitialspace=True)
+    df = _read_cached(MODULE_PATH + '/data/compas-scores-two-years.csv', delimiter=',', skipinitialspace=True)
 
     columns = ['age', 'age_cat', 'sex', 'race', 'priors_count', 'days_b_screening_arrest', 'c_jail_in', 'c_jail_out',
                'c_charge_degree', 'is_recid', 'is_violent_recid', 'two_year_recid', 'decile_score', 'score_text']
@@ -166,24 +240,14 @@ def load_compas():
 
     df['days_b_screening_arrest'] = np.abs(df['days_b_screening_arrest'])
 
-    df['c_jail_out'] = pd.to_datetime(df['c_jail_out'])
-    df['c_jail_in'] = pd.to_datetime(df['c_jail_in'])
-    df['length_of_stay'] = (df['c_jail_out'] - df['c_jail_in']).dt.days
-    df['length_of_stay'] = np.abs(df['length_of_stay'])
-
-    df['length_of_stay'].fillna(df['length_of_stay'].value_counts().index[0], inplace=True)
-    df['days_b_screening_arrest'].fillna(df['days_b_screening_arrest'].value_counts().index[0], inplace=True)
-
-    df['length_of_stay'] = df['length_of_stay'].astype(int)
-    df['days_b_screening_arrest'] = df['days_b_screening_arrest'].astype(int)
+    jail_in = np.array(df['c_jail_in'].to_numpy(na_value='NaT', dtype=object), dtype='datetime64[s]')
+    jail_out = np.array(df['c_jail_out'].to_numpy(na_value='NaT', dtype=object), dtype='datetime64[s]')
+    df['length_of_stay'] = np.abs(np.floor((jail_out - jail_in) / np.timedelta64(1, 'D')))
 
-    def get_class(x):
-        if x < 7:
-            return 'Medium-Low'
-        else:
-            return 'High'
+    fill_columns = ['length_of_stay', 'days_b_screening_arrest']
+    df[fill_columns] = df[fill_columns].fillna(df[fill_columns].mode().iloc[0]).astype(int)
 
-    df['class'] = df['decile_score'].apply(get_class)
+    df['class'] = np.where(df['decile_score'].to_numpy() < 7, 'Medium-Low', 'High')
 
     del df['c_jail_in']
     del df['c_jail_out']
@@ -208,7 +272,7 @@ def load_heloc():
     dataset : dict
     """
     # Read Dataset
-    df = pd.read_csv(MODULE_PATH + '/data/heloc_dataset_v1.csv', delimiter=',')
+    df = _read_cached(MODULE_PATH + '/data/heloc_dataset_v1.csv', delimiter=',')
 
     # Features Categorization
     columns = df.columns
@@ -227,7 +291,7 @@ def load_beer():
     dataset : dict
     """
     # Read Dataset
-    df = pd.read_csv(MODULE_PATH + '/data/beer.csv', delimiter=',')
+    df = _read_cached(MODULE_PATH + '/data/beer.csv', delimiter=',')
 
     # Features Categorization
     class_name = 'beer_style'
@@ -250,7 +314,7 @@ def load_pima():
     dataset : dict
     """
     # Read Dataset
-    df = pd.read_csv(MODULE_PATH + '/data/pima-indians-diabetes.csv', delimiter=',')
+    df = _read_cached(MODULE_PATH + '/data/pima-indians-diabetes.csv', delimiter=',')
 
     # Features Categorization
     class_name = 'Class'
@@ -273,7 +337,7 @@ def load_breast():
     dataset : dict
     """
     # Read Dataset
-    df = pd.read_csv(MODULE_PATH + '/data/breast.csv', delimiter=',')
+    df = _read_cached(MODULE_PATH + '/data/breast.csv', delimiter=',')
     del df['id']
 
     # Features Categorization
@@ -1,4 +1,7 @@
+import pandas as pd
+
 from teacher.datasets import load_german, load_adult, load_compas, load_heloc, load_beer, load_breast, load_pima
+from teacher.datasets._base import _read_cached
 
 
 def check_data(load_data, dataset_values):
@@ -294,3 +297,21 @@ def test_load_breast():
         'yshape': (569,)
     }
     check_data(load_breast, dataset_values)
+
+
+def test_read_cached_corrupt_cache(tmp_path):
+
+    csv_path = str(tmp_path / 'dataset.csv')
+    df = pd.DataFrame({'age': [20, 30], 'class': ['a', 'b']})
+    df.to_csv(csv_path, index=False)
+
+    first = _read_cached(csv_path, delimiter=',')
+    pd.testing.assert_frame_equal(first, df)
+
+    # A corrupt cache stays newer than the csv, so it must fall back to
+    # the csv parse instead of breaking every subsequent load
+    with open(csv_path + '.pkl', 'wb') as cache_file:
+        cache_file.write(b'not a pickle')
+
+    second = _read_cached(csv_path, delimiter=',')
+    pd.testing.assert_frame_equal(second, df)
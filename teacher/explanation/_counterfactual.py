@@ -11,7 +11,7 @@ from copy import deepcopy
 import numpy as np
 
 # Local application
-from teacher.tree import Rule
+from teacher.tree import RuleSet
 
 
 # =============================================================================
@@ -113,9 +113,10 @@ def _apply_changes(rule, instance):
 def _search_counterfactual(instance, class_val, rule_list, cf_list):
     """Iterate through the cf_list to find the first rule that generates a valid counterfactual"""
     sorted_cf = sorted(cf_list, key=lambda rule: rule[1])
+    rule_set = RuleSet(rule_list)
     for cf in sorted_cf:
         new_instance, changes = _apply_changes(cf[0], instance)
-        new_class_val = Rule.weighted_vote(rule_list, new_instance)
+        new_class_val = rule_set.weighted_vote(new_instance)
         if new_class_val != class_val:
             return changes
 
@@ -7,9 +7,16 @@ from math import log2, inf, pow
 
 # Third party
 import numpy as np
-import pandas as pd
-import skfuzzy as fuzz
 import matplotlib.pyplot as plt
+from scipy.special import xlogy
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Number of candidate points evaluated per vectorized block, so the
+# membership matrices stay bounded at BLOCK x n_samples elements
+_CANDIDATE_BLOCK = 256
 
 # =============================================================================
 # Functions
@@ -31,14 +38,7 @@ def _equal_width(variable, sets):
     array
         Points of division between the partitions
     """
-    try:
-        cut = pd.cut(variable, sets - 1)
-        sol = [cat.left for cat in cut.categories] + [cut.categories[-1].right]
-    except ValueError:  # pragma: no cover
-        cut = pd.cut(variable, sets - 1, duplicates='drop')
-        sol = [variable.min()] + [cat.left for cat in cut.categories] + [cut.categories[-1].right]
-    sol[0] = variable.min()
-    return sol
+    return np.linspace(variable.min(), variable.max(), sets).tolist()
 
 
 def _equal_freq(variable, sets):
@@ -56,44 +56,96 @@ def _equal_freq(variable, sets):
     array
         Points of division between the partitions
     """
-    try:
-        qcut = pd.qcut(variable, sets - 1)
-        sol = [cat.left for cat in qcut.categories] + [qcut.categories[-1].right]
-        sol[0] = variable.min()
-    except ValueError:
-        qcut = pd.qcut(variable, sets - 1, duplicates='drop')
-        sol = [variable.min()] + [cat.left for cat in qcut.categories] + [qcut.categories[-1].right]
-        sol[1] = sol[0]
-    return sol
+    return np.unique(np.quantile(variable, np.linspace(0, 1, sets))).tolist()
+
+
+def _candidate_wfe(variable, class_masks, candidates, min_point, max_point):
+    """Compute the weighted fuzzy entropy of the three-triangle partition
+    ``[min_point, point, max_point]`` for every candidate point at once.
+
+    The low/mid/high membership degrees of all the candidates are evaluated
+    as broadcast NumPy expressions equivalent to ``skfuzzy.trimf``, so no
+    Python-level loop over the candidate points is needed.
+
+    Parameters
+    ----------
+    variable : numpy.ndarray
+        Variable from the dataset to partition
+    class_masks : numpy.ndarray, of shape (n_classes, n_samples)
+        Boolean mask of the instances belonging to each class value
+    candidates : numpy.ndarray
+        Candidate mid points, all strictly between *min_point* and *max_point*
+    min_point : float
+        Lower limit of the partition
+    max_point : float
+        Upper limit of the partition
+
+    Returns
+    -------
+    wfe : numpy.ndarray
+        Weighted fuzzy entropy for each candidate point
+    memberships : dict
+        Dictionary with format {set_name: matrix} where each row of the
+        matrix holds the membership degrees to that set for one candidate
+    """
+    v = variable[None, :]
+    p = candidates[:, None]
+
+    memberships = {
+        'low': np.clip((p - v) / (p - min_point), 0, 1),
+        'mid': np.clip(np.minimum((v - min_point) / (p - min_point),
+                                  (max_point - v) / (max_point - p)), 0, 1),
+        'high': np.clip((v - p) / (max_point - p), 0, 1)
+    }
+
+    wfe = np.zeros(len(candidates))
+    for triangle in memberships.values():
+        fuzzy_cardinality = triangle.sum(axis=1)
+        class_cardinality = np.einsum('kn,cn->kc', triangle, class_masks)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = class_cardinality / fuzzy_cardinality[:, None]
+        fent = -np.sum(xlogy(ratio, ratio), axis=1) / np.log(2)
+        wfe += fuzzy_cardinality * np.nan_to_num(fent)
+    return wfe / variable.size, memberships
 
 
 def _fuzzy_discretization(variable, class_variable, min_point, verbose=False):
-    max_point = variable.max()
+    codes = np.unique(np.asarray(class_variable), return_inverse=True)[1]
+    return _fuzzy_discretization_coded(variable, codes, codes.max() + 1, min_point, np.unique(variable), verbose)
+
+
+def _fuzzy_discretization_coded(variable, codes, n_classes, min_point, uniques, verbose=False):
+    max_point = uniques[-1]
+
+    candidates = uniques[(uniques != min_point) & (uniques != max_point)]
+    if candidates.size == 0:
+        return [min_point, max_point]
+
+    class_masks = np.identity(n_classes, dtype=np.float64)[:, codes]
+
     best_point = 0
     best_wfe = inf
     best_fuzzy_triangle = []
-    for point in np.unique(variable):
-        if point != min_point and point != max_point:
-            divisions = [('low', min_point), ('mid', point), ('high', max_point)]
-            fuzzy_triangle = _fuzzy_triangle(variable, divisions)
-            wfe = _weighted_fuzzy_entropy(fuzzy_triangle, class_variable)
+    for start in range(0, candidates.size, _CANDIDATE_BLOCK):
+        block = candidates[start:start + _CANDIDATE_BLOCK]
+        wfe_block, memberships = _candidate_wfe(variable, class_masks, block, min_point, max_point)
 
-            if verbose:  # pragma: no cover
-                print('\t----------------')
-                print(f'\t{divisions}')
+        if verbose:  # pragma: no cover
+            for point, wfe in zip(block, wfe_block):
                 print('\t----------------')
                 print(f'\tPoint: {point}')
                 print(f'\twfe: {wfe}')
                 print('\t-----------------')
 
-            if wfe < best_wfe:
-                best_wfe = wfe
-                best_point = point
-                best_fuzzy_triangle = fuzzy_triangle
+        block_idx = np.argmin(wfe_block)
+        if wfe_block[block_idx] < best_wfe:
+            best_wfe = wfe_block[block_idx]
+            best_point = block[block_idx]
+            best_fuzzy_triangle = {name: triangle[block_idx] for name, triangle in memberships.items()}
 
     divisions = [('low', min_point), ('high', max_point)]
     global_fuzzy_triangles = _fuzzy_triangle(variable, divisions)
-    global_wfe = _weighted_fuzzy_entropy(global_fuzzy_triangles, class_variable)
+    global_wfe = _weighted_fuzzy_entropy_coded(global_fuzzy_triangles, codes)
     if verbose:  # pragma: no cover
         print(f'Best point: {best_point}')
         print(f'Best Weighted Fuzzy Entropy: {best_wfe}')
@@ -102,7 +154,7 @@ def _fuzzy_discretization(variable, class_variable, min_point, verbose=False):
     f_gain = global_wfe - best_wfe
 
     cardinality = len(variable)
-    delta = _get_delta_point(global_fuzzy_triangles, best_fuzzy_triangle, class_variable)
+    delta = _get_delta_point_coded(global_fuzzy_triangles, best_fuzzy_triangle, codes)
     threshold = (log2(cardinality - 1) + delta) / cardinality
 
     if verbose:   # pragma: no cover
@@ -111,19 +163,20 @@ def _fuzzy_discretization(variable, class_variable, min_point, verbose=False):
         print('-----------------')
 
     if not f_gain < threshold:
-        left = ([(p, c) for p, c in zip(variable, class_variable) if p <= best_point])
-        right = ([(p, c) for p, c in zip(variable, class_variable) if p > best_point])
-
-        left_variable, left_class = zip(*left)
-        right_variable, right_class = zip(*right)
+        mask = variable <= best_point
+        # The sorted unique values of each branch are a slice of the
+        # current ones, so they never need to be recomputed
+        cut = np.searchsorted(uniques, best_point, side='right')
 
         left_points = []
         right_points = []
 
-        if len(left_variable) > 1:
-            left_points = _fuzzy_discretization(np.array(left_variable), left_class, min_point, verbose)
-        if len(right_variable) > 1:
-            right_points = _fuzzy_discretization(np.array(right_variable), right_class, best_point, verbose)
+        if mask.sum() > 1:
+            left_points = _fuzzy_discretization_coded(variable[mask], codes[mask], n_classes, min_point,
+                                                      uniques[:cut], verbose)
+        if (~mask).sum() > 1:
+            right_points = _fuzzy_discretization_coded(variable[~mask], codes[~mask], n_classes,
+                                                       best_point, uniques[cut:], verbose)
         points = left_points + right_points
         return np.unique(points).tolist()
     else:
@@ -148,22 +201,40 @@ def _fuzzy_entropy(triangle, class_variable, verbose=False):
     float
         Fuzzy entropy of the subset
     """
-    fe = 0
-    for value in np.unique(class_variable):
-        class_fuzzy_cardinality = 0
-        for i in range(len(triangle)):
-            if class_variable[i] == value:
-                class_fuzzy_cardinality += triangle[i]
+    triangle = np.asarray(triangle, dtype=np.float64)
+    codes = np.unique(np.asarray(class_variable), return_inverse=True)[1]
+    return _fuzzy_entropy_coded(triangle, codes, verbose)
+
+
+def _fuzzy_entropy_coded(triangle, codes, verbose=False):
+    """Compute the fuzzy entropy of a given fuzzy subset
+    whose class labels have already been encoded as integers
+
+    Parameters
+    ----------
+    triangle : np.array
+        Numpy array with the degree of pertenence for a particular
+        fuzzy variable for each instance
+    codes : np.array
+        Numpy array with the integer-encoded class of each instance
+    verbose : bool, optional
+        Verbose flag, by default False
 
-        if class_fuzzy_cardinality > 0:  # i.e. There are elements belonging to this class value
-            fuzzy_cardinality = triangle.sum()
-            if verbose:   # pragma: no cover
-                print(f'class_fuzzy_cardinality: {class_fuzzy_cardinality}')
-                print(f'fuzzy_cardinality: {fuzzy_cardinality}')
-            ratio = class_fuzzy_cardinality / fuzzy_cardinality
-            fe += -ratio * log2(ratio)
+    Returns
+    -------
+    float
+        Fuzzy entropy of the subset
+    """
+    fuzzy_cardinality = triangle.sum()
+    if fuzzy_cardinality <= 0:  # i.e. No elements belong to the subset
+        return 0
 
-    return fe
+    class_fuzzy_cardinality = np.bincount(codes, weights=triangle)
+    if verbose:   # pragma: no cover
+        print(f'class_fuzzy_cardinality: {class_fuzzy_cardinality}')
+        print(f'fuzzy_cardinality: {fuzzy_cardinality}')
+    ratio = class_fuzzy_cardinality / fuzzy_cardinality
+    return float(-np.sum(xlogy(ratio, ratio)) / np.log(2))
 
 
 def _fuzzy_triangle(variable, divisions, verbose=False):
@@ -188,16 +259,22 @@ def _fuzzy_triangle(variable, divisions, verbose=False):
         and the value is an array of the pertenence to the set of each value of the
         variable
     """
-    fuzz_dict = {}
-    # First triangle is only half triangle
-    fuzz_dict[divisions[0][0]] = fuzz.trimf(variable, [divisions[0][1], divisions[0][1], divisions[1][1]])
-
-    for i in range(len(divisions) - 2):
-        fuzz_dict[divisions[i + 1][0]] = fuzz.trimf(variable,
-                                                    [divisions[i][1], divisions[i + 1][1], divisions[i + 2][1]])
-
-    # Last triangle is only half triangle
-    fuzz_dict[divisions[-1][0]] = fuzz.trimf(variable, [divisions[-2][1], divisions[-1][1], divisions[-1][1]])
+    points = np.array([division[1] for division in divisions], dtype=np.float64)
+    variable = np.asarray(variable, dtype=np.float64)
+
+    # The triangles form a partition of unity, so each value only belongs
+    # to the two sets whose peaks bracket it: one searchsorted pass finds
+    # the bracket and the rising/falling edges fill all the sets at once.
+    memberships = np.zeros((points.size, variable.size))
+    upper = np.clip(np.searchsorted(points, variable, side='right'), 1, points.size - 1)
+    span = points[upper] - points[upper - 1]
+    rise = np.clip((variable - points[upper - 1]) / span, 0, 1)
+    fall = np.clip((points[upper] - variable) / span, 0, 1)
+    instances = np.arange(variable.size)
+    memberships[upper, instances] = rise
+    memberships[upper - 1, instances] = fall
+
+    fuzz_dict = {division[0]: memberships[i] for i, division in enumerate(divisions)}
 
     if verbose:  # pragma: no cover
         fig, ax0 = plt.subplots(nrows=1)
@@ -223,21 +300,43 @@ def _weighted_fuzzy_entropy(fuzzy_triangle, class_variable):
     class_variable : np.array
         Numpy array with the class value of each instance of the partition
 
+    Returns
+    -------
+    float
+        Weighted fuzzy entropy
+    """
+    codes = np.unique(np.asarray(class_variable), return_inverse=True)[1]
+    return _weighted_fuzzy_entropy_coded(fuzzy_triangle, codes)
+
+
+def _weighted_fuzzy_entropy_coded(fuzzy_triangle, codes):
+    """Function to compute the weighted fuzzy entropy of a given fuzzy
+    partition whose class labels have already been encoded as integers
+
+    Parameters
+    ----------
+    fuzzy_triangle : dict
+        Dictionary with the fuzzy sets and an array with the pertenence degree
+        of each instance of the partition to that fuzzy set
+    codes : np.array
+        Numpy array with the integer-encoded class of each instance
+        of the partition
+
     Returns
     -------
     float
         Weighted fuzzy entropy
     """
     wfe = 0
-    crisp_cardinality = len(class_variable)  # Number of elements in the partition
+    crisp_cardinality = len(codes)  # Number of elements in the partition
     for triangle in fuzzy_triangle:
         fuzzy_cardinality = fuzzy_triangle[triangle].sum()
-        fent = _fuzzy_entropy(fuzzy_triangle[triangle], class_variable)
+        fent = _fuzzy_entropy_coded(fuzzy_triangle[triangle], codes)
         wfe += fuzzy_cardinality * fent
     return wfe / crisp_cardinality
 
 
-def _get_delta_point(global_fuzzy_triangles, best_fuzzy_triangle, class_variable, verbose=False):
+def _get_delta_point_coded(global_fuzzy_triangles, best_fuzzy_triangle, codes, verbose=False):
     """Given a set of instances partitioned in two fuzzy sets (global_fuzzy_triangles)
     and a partitioning of three fuzzy sets of the same instances (best_fuzzy_triangle),
     identifies if it is necessary to do that partitioning
@@ -250,8 +349,9 @@ def _get_delta_point(global_fuzzy_triangles, best_fuzzy_triangle, class_variable
     best_fuzzy_triangle : dict
         Dictionary with the format {key : value} obtained from _fuzzy_triangle
         with three fuzzy partitions
-    class_variable : np.array
-        Numpy array with the class values for the instances of the fuzzy partition
+    codes : np.array
+        Numpy array with the integer-encoded class of each instance
+        of the fuzzy partition
     verbose : bool, optional
         Verbose flag, by default False
 
@@ -260,19 +360,17 @@ def _get_delta_point(global_fuzzy_triangles, best_fuzzy_triangle, class_variable
     Float
         Delta point
     """
-    n_classes = len(np.unique(class_variable))
+    n_classes = np.count_nonzero(np.bincount(codes))
 
     old_f_entropy = 0
     new_f_entropy = 0
     for triangle in global_fuzzy_triangles:
-        old_f_entropy += n_classes * _fuzzy_entropy(global_fuzzy_triangles[triangle], class_variable)
+        old_f_entropy += n_classes * _fuzzy_entropy_coded(global_fuzzy_triangles[triangle], codes)
 
     for triangle in best_fuzzy_triangle:
-        bft = np.array(best_fuzzy_triangle[triangle])
-        cv = np.array(class_variable)
-        classes = cv[bft > 0]
-        new_n_classes = len(np.unique(classes))
-        new_f_entropy += new_n_classes * _fuzzy_entropy(best_fuzzy_triangle[triangle], class_variable)
+        bft = best_fuzzy_triangle[triangle]
+        new_n_classes = np.count_nonzero(np.bincount(codes[bft > 0]))
+        new_f_entropy += new_n_classes * _fuzzy_entropy_coded(best_fuzzy_triangle[triangle], codes)
     if verbose:   # pragma: no cover
         print(f'Old Entropy: {old_f_entropy:.3f}')
         print(f'New Entropy: {new_f_entropy:.3f}')
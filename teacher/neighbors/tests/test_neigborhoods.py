@@ -240,10 +240,12 @@ def test_lore_neighborhood(prepare_beer):
                          df_categorical_columns=df_categorical_columns)
 
     neighborhood_X_membership = neighborhood.get_X_membership()
+    color_mid = 12.236026930954289
+    color_max = 15.472053861908577
     expected_X_membership = {
         'color': {'9.0': np.array([1., 1., 1., 1., 1., 1., 1., 0., 1.]),
-                  '12.236': np.array([0., 0., 0., 0., 0., 0., 0., 0., 0.]),
-                  '15.472': np.array([0., 0., 0., 0., 0., 0., 0., 0., 0.])},
+                  str(color_mid): np.array([0., 0., 0., 0., 0., 0., 0., 0., 0.]),
+                  str(color_max): np.array([0., 0., 0., 0., 0., 0., 0., 1., 0.])},
         'bitterness': {'25.0': np.array([1., 1., 1., 1., 1., 1., 1., 1., 1.])},
         'strength': {'0.053': np.array([0., 0., 1., 0., 0., 1., 1., 1., 0.]),
                      '0.08': np.array([0.96296296, 0.96296296, 0., 0., 0.96296296, 0., 0., 0., 0.96296296]),
@@ -256,10 +258,11 @@ def test_lore_neighborhood(prepare_beer):
                                            expected_X_membership[key][fuzzy_set])
 
     expected_fuzzy_vars = [
-        FuzzyVariable(name='color', fuzzy_sets=[FuzzyContinuousSet(name='9.0', fuzzy_points=[9.0, 9.0, 12.236]),
-                                                FuzzyContinuousSet(name='12.236', fuzzy_points=[9.0, 12.236, 15.472]),
-                                                FuzzyContinuousSet(name='15.472',
-                                                                   fuzzy_points=[12.236, 15.472, 15.472])]),
+        FuzzyVariable(name='color', fuzzy_sets=[FuzzyContinuousSet(name='9.0', fuzzy_points=[9.0, 9.0, color_mid]),
+                                                FuzzyContinuousSet(name=str(color_mid),
+                                                                   fuzzy_points=[9.0, color_mid, color_max]),
+                                                FuzzyContinuousSet(name=str(color_max),
+                                                                   fuzzy_points=[color_mid, color_max, color_max])]),
         FuzzyVariable(name='bitterness', fuzzy_sets=[FuzzyContinuousSet(name='25.0', fuzzy_points=[25.0, 25.0, 25.0],
                                                                         point_set=True)]),
         FuzzyVariable(name='strength', fuzzy_sets=[FuzzyContinuousSet(name='0.053', fuzzy_points=[0.053, 0.053, 0.08]),
@@ -272,8 +275,8 @@ def test_lore_neighborhood(prepare_beer):
     expected_instance_membership = {
         'color': {
             '9.0': np.array([0.]),
-            '12.236': np.array([0.]),
-            '15.472': np.array([0.])},
+            str(color_mid): np.array([0.]),
+            str(color_max): np.array([0.])},
         'bitterness': {'25.0': np.array([0.])},
         'strength': {
             '0.053': np.array([0.]),
@@ -33,7 +33,7 @@ The classes are the following ones:
 from .id3_tree import ID3
 from .fdt_tree import FDT
 from .base_decision_tree import BaseDecisionTree
-from .rule import Rule
+from .rule import Rule, RuleSet
 
 
 # =============================================================================
@@ -43,5 +43,6 @@ __all__ = [
     "BaseDecisionTree",
     "ID3",
     "FDT",
-    "Rule"
+    "Rule",
+    "RuleSet"
 ]
@@ -2,9 +2,6 @@
 # Imports
 # =============================================================================
 
-# Standard
-from collections import defaultdict
-
 # Third party
 import numpy as np
 
@@ -13,17 +10,40 @@ import numpy as np
 # =============================================================================
 
 
+def _reduce_vote(all_classes, op):
+    """Accumulate the weighted contribution of every leaf to every class
+    value with a single NumPy reduction indexed by integer class ids
+
+    Parameters
+    ----------
+    all_classes : array-like
+        Pairs (class_values, weight) with the per-class probabilities of
+        each leaf and the membership of the instances to that leaf
+    op : numpy ufunc
+        Reduction used to combine the contributions of the leaves
+
+    Returns
+    -------
+    dict
+        Dictionary with format {class_value: aggregated weight}
+    """
+    class_index = {}
+    ids = []
+    contributions = []
+    for leaf_classes, weight in all_classes:
+        for class_value, prob in leaf_classes.items():
+            ids.append(class_index.setdefault(class_value, len(class_index)))
+            contributions.append(prob * weight)
+
+    contributions = np.asarray(contributions, dtype=np.float64)
+    agg = np.zeros((len(class_index),) + contributions.shape[1:])
+    op.at(agg, ids, contributions)
+    return {class_value: agg[i] for class_value, i in class_index.items()}
+
+
 def _aggregated_vote(all_classes):
-    agg_vote = defaultdict(lambda: 0)
-    for leaf in all_classes:
-        for key in leaf[0]:
-            agg_vote[key] += leaf[0][key] * leaf[1]
-    return agg_vote
+    return _reduce_vote(all_classes, np.add)
 
 
 def _maximum_matching(all_classes):
-    max_match = defaultdict(lambda: 0)
-    for leaf in all_classes:
-        for key in leaf[0]:
-            max_match[key] = np.maximum(max_match[key], (leaf[0][key] * leaf[1]))
-    return max_match
+    return _reduce_vote(all_classes, np.maximum)
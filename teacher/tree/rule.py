@@ -2,8 +2,8 @@
 # Imports
 # =============================================================================
 
-# Standard
-from collections import defaultdict
+# Third party
+import numpy as np
 
 # =============================================================================
 # Classes
@@ -73,11 +73,7 @@ class Rule:
         string or number
             consequent associated with the instance and the rule list
         """
-        conse_dict = defaultdict(lambda: 0)
-        for rule in rule_list:
-            AD = rule.matching(instance_membership) * rule.weight
-            conse_dict[rule.consequent] += AD
-        return max(conse_dict, key=lambda conse: conse_dict[conse])
+        return RuleSet(rule_list).weighted_vote(instance_membership)
 
     @staticmethod
     def map_rule_variables(rule, origin_fuzzy_variables, dest_fuzzy_variables):
@@ -98,6 +94,36 @@ class Rule:
         Rule
             Rule with the new variables
 
+        Raises
+        ------
+        ValueError
+            If the universes of the variables are not the same
+            it raises an error
+        """
+        return Rule.map_rules_variables([rule], origin_fuzzy_variables, dest_fuzzy_variables)[0]
+
+    @staticmethod
+    def map_rules_variables(rules, origin_fuzzy_variables, dest_fuzzy_variables):
+        """Changes the fuzzy variables of several rules
+        for ones that are defined in the same universe,
+        computing the best destination set of each distinct
+        (feature, value) antecedent pair only once instead of
+        intersecting every destination set again per rule
+
+        Parameters
+        ----------
+        rules : Iterable[Rule]
+            Original rules to map to the new variables
+        origin_fuzzy_variables : list[FuzzyVariable]
+            List with the original fuzzy variables
+        dest_fuzzy_variables : list[FuzzyVariable]
+            List with the destination fuzzy variables
+
+        Returns
+        -------
+        list[Rule]
+            Rules with the new variables
+
         Raises
         ------
         ValueError
@@ -111,15 +137,114 @@ class Rule:
         if origin_dict.keys() != dest_dict.keys():
             raise ValueError('The universes of the fuzzy variables are not the same')
 
-        new_antecedent = []
-        for feat, value in rule.antecedent:
-            origin_feat = origin_dict[feat]
-            dest_feat = dest_dict[feat]
+        best_match = {}
+        new_rules = []
+        for rule in rules:
+            new_antecedent = []
+            for feat, value in rule.antecedent:
+                if (feat, value) not in best_match:
+                    origin_fuzzy_sets = {fs.name: fs for fs in origin_dict[feat]}
+                    origin_fs = origin_fuzzy_sets[value]
+
+                    dest_fs = max(dest_dict[feat], key=lambda fs: fs.intersection(origin_fs))
+                    best_match[(feat, value)] = dest_fs.name
+                new_antecedent.append((feat, best_match[(feat, value)]))
+            new_rules.append(Rule(new_antecedent, rule.consequent, rule.weight))
+
+        return new_rules
+
+
+class RuleSet:
+    """Encoded view of a list of rules that evaluates the matching of
+    all the rules at once with NumPy reductions instead of one Python
+    loop per rule.
+
+    The antecedents are stored struct-of-arrays style: every feature and
+    every value within a feature is assigned an integer id once at
+    construction, and the whole rule base becomes two contiguous int16
+    matrices plus a validity mask for the padded positions. Matching an
+    instance is then one dense membership gather followed by a
+    vectorized minimum across the antecedent positions of every rule.
+    """
+
+    def __init__(self, rules):
+        """
+        Parameters
+        ----------
+        rules : list[Rule]
+            List with the rules to encode
+        """
+        self.rules = list(rules)
+
+        self._feature_index = {}
+        self._value_index = {}
+        for rule in self.rules:
+            for feature, value in rule.antecedent:
+                self._feature_index.setdefault(feature, len(self._feature_index))
+                values = self._value_index.setdefault(feature, {})
+                values.setdefault(value, len(values))
+
+        max_antecedent = max((len(rule.antecedent) for rule in self.rules), default=0)
+        shape = (len(self.rules), max(max_antecedent, 1))
+        self._feat_ids = np.zeros(shape, dtype=np.int16)
+        self._val_ids = np.zeros(shape, dtype=np.int16)
+        self._valid = np.zeros(shape, dtype=bool)
+        for i, rule in enumerate(self.rules):
+            for j, (feature, value) in enumerate(rule.antecedent):
+                self._feat_ids[i, j] = self._feature_index[feature]
+                self._val_ids[i, j] = self._value_index[feature][value]
+                self._valid[i, j] = True
+
+        self._weights = np.array([rule.weight for rule in self.rules], dtype=np.float64)
+        conse_index = {}
+        for rule in self.rules:
+            conse_index.setdefault(rule.consequent, len(conse_index))
+        self._consequents = list(conse_index)
+        self._conse_codes = np.array([conse_index[rule.consequent] for rule in self.rules], dtype=np.intp)
+
+    def matching(self, instance_membership):
+        """Matching that an instance has with every rule of the set
+        If there is some feature or value not existing in the instance,
+        the matching degree of the affected rules is zero
+
+        Parameters
+        ----------
+        instance_membership : dict
+            Membership of the instance with the format {feature: {value: pertenence degree}}
 
-            origin_fuzzy_sets = {fs.name: fs for fs in origin_feat}
-            origin_fs = origin_fuzzy_sets[value]
+        Returns
+        -------
+        numpy.ndarray
+            Matching degree of the instance with each rule
+        """
+        n_values = max((len(values) for values in self._value_index.values()), default=0)
+        degrees = np.zeros((max(len(self._feature_index), 1), max(n_values, 1)))
+        for feature, feat_id in self._feature_index.items():
+            feature_membership = instance_membership.get(feature)
+            if feature_membership is None:
+                continue  # Missing feature: its pairs keep degree zero
+            for value, val_id in self._value_index[feature].items():
+                try:
+                    degrees[feat_id, val_id] = feature_membership[value]
+                except KeyError:
+                    pass  # Missing value: the pair keeps degree zero
+        return np.where(self._valid, degrees[self._feat_ids, self._val_ids], 1).min(axis=1)
+
+    def weighted_vote(self, instance_membership):
+        """Use the weighted vote inference method to return the consequent
+        associated to an instance given the instance membership
 
-            dest_fs = max(dest_feat, key=lambda fs: fs.intersection(origin_fs))
-            new_antecedent.append((feat, dest_fs.name))
+        Parameters
+        ----------
+        instance_membership : dict
+            Membership of the instance with the format
+            {feature: {value: pertenence degree}}
 
-        return Rule(new_antecedent, rule.consequent, rule.weight)
+        Returns
+        -------
+        string or number
+            consequent associated with the instance and the rule set
+        """
+        AD = self.matching(instance_membership) * self._weights
+        scores = np.bincount(self._conse_codes, weights=AD, minlength=len(self._consequents))
+        return self._consequents[np.argmax(scores)]
@@ -1,6 +1,7 @@
 from teacher.fuzzy.fuzzy_set import FuzzyContinuousSet, FuzzyDiscreteSet
 from teacher.fuzzy.fuzzy_variable import FuzzyVariable
-from teacher.tree import Rule
+from teacher.tree import Rule, RuleSet
+import numpy as np
 import pytest
 
 
@@ -101,6 +102,75 @@ def test_weighted_vote():
     assert Rule.weighted_vote(rule_list, instance_membership) == 'conse_two'
 
 
+def test_rule_set_matching():
+    instance_membership = {
+        'height': {'low': 0.3, 'high': 0.7},
+        'color': {'red': 1, 'blue': 0}
+    }
+
+    rule_one = Rule([('height', 'high'), ('color', 'red')], 'conse', 0.4)
+    rule_two = Rule([('height', 'low'), ('color', 'red')], 'conse_two', 1)
+    rule_three = Rule([('height', 'high'), ('color', 'blue')], 'conse', 0.7)
+    rule_set = RuleSet([rule_one, rule_two, rule_three])
+
+    np.testing.assert_almost_equal(rule_set.matching(instance_membership), [0.7, 0.3, 0])
+
+
+def test_rule_set_matching_padded_antecedents():
+    instance_membership = {
+        'height': {'low': 0.3, 'high': 0.7},
+        'color': {'red': 1, 'blue': 0}
+    }
+
+    rule_one = Rule([('height', 'high')], 'conse', 0.4)
+    rule_two = Rule([('height', 'low'), ('color', 'red')], 'conse_two', 1)
+    rule_set = RuleSet([rule_one, rule_two])
+
+    # The padding of the shorter rule must not drag its minimum to zero
+    np.testing.assert_almost_equal(rule_set.matching(instance_membership), [0.7, 0.3])
+
+
+def test_rule_set_matching_missing_feature():
+    instance_membership = {
+        'height': {'low': 0.3, 'high': 0.7},
+    }
+
+    rule_one = Rule([('height', 'high')], 'conse', 0.4)
+    rule_two = Rule([('height', 'low'), ('color', 'red')], 'conse_two', 1)
+    rule_set = RuleSet([rule_one, rule_two])
+
+    np.testing.assert_almost_equal(rule_set.matching(instance_membership), [0.7, 0])
+
+
+def test_rule_set_matching_missing_value():
+    instance_membership = {
+        'height': {'low': 0.3, 'high': 0.7},
+        'color': {'red': 1}
+    }
+
+    rule_one = Rule([('height', 'high'), ('color', 'red')], 'conse', 0.4)
+    rule_two = Rule([('height', 'high'), ('color', 'blue')], 'conse_two', 1)
+    rule_set = RuleSet([rule_one, rule_two])
+
+    np.testing.assert_almost_equal(rule_set.matching(instance_membership), [0.7, 0])
+
+
+def test_rule_set_weighted_vote():
+    instance_membership = {
+        'height': {'low': 0.3, 'high': 0.7},
+        'color': {'red': 1, 'blue': 0}
+    }
+
+    rule_one = Rule([('height', 'high'), ('color', 'red')], 'conse', 0.4)
+    rule_two = Rule([('height', 'low'), ('color', 'red')], 'conse_two', 1)
+    rule_three = Rule([('height', 'high'), ('color', 'blue')], 'conse', 0.7)
+    rule_list = [rule_one, rule_two, rule_three]
+
+    assert RuleSet(rule_list).weighted_vote(instance_membership) == 'conse_two'
+    assert RuleSet(rule_list).weighted_vote(instance_membership) == Rule.weighted_vote(rule_list,
+                                                                                       instance_membership)
+
+
 def test_map_rule_variables_different_universe(get_fuzzy_sets):
     fuzzy_sets_color_1, fuzzy_sets_color_2, fuzzy_sets_height_1, fuzzy_sets_height_2 = get_fuzzy_sets
     with pytest.raises(ValueError):
@@ -136,3 +206,30 @@ def test_map_rule_variables(get_fuzzy_sets):
     dest_rule = Rule((('height', 'low'), ('color', 'red')), 'conse', 1)
 
     assert Rule.map_rule_variables(original_rule, fuzzy_vars_1, fuzzy_vars_2) == dest_rule
+
+
+def test_map_rules_variables(get_fuzzy_sets):
+    fuzzy_sets_color_1, fuzzy_sets_color_2, fuzzy_sets_height_1, fuzzy_sets_height_2 = get_fuzzy_sets
+
+    fuzzy_vars_1 = [
+        FuzzyVariable('height', fuzzy_sets_height_1),
+        FuzzyVariable('color', fuzzy_sets_color_1)
+    ]
+
+    fuzzy_vars_2 = [
+        FuzzyVariable('height', fuzzy_sets_height_2),
+        FuzzyVariable('color', fuzzy_sets_color_2)
+    ]
+
+    # The (height, high) pair repeats so the second rule reuses the
+    # memoized destination set
+    original_rules = [
+        Rule((('height', 'high'), ('color', 'red')), 'conse', 1),
+        Rule((('height', 'high'), ('color', 'blue')), 'conse_two', 0.5)
+    ]
+    dest_rules = [
+        Rule((('height', 'low'), ('color', 'red')), 'conse', 1),
+        Rule((('height', 'low'), ('color', 'blue')), 'conse_two', 0.5)
+    ]
+
+    assert Rule.map_rules_variables(original_rules, fuzzy_vars_1, fuzzy_vars_2) == dest_rules